@@ -7,16 +7,18 @@ class CookiesManager:
     CookiesManager: A class to handle loading cookies into a Selenium WebDriver instance.
     """
 
-    def __init__(self, base_dir=None, verbose=False):
+    def __init__(self, base_dir=None, verbose=False, log_func=None):
         """
         Initializes the CookiesManager object with the specified parameters.
 
         Args:
             base_dir (str): The base directory where cookie files are stored. If None, expects absolute paths.
             verbose (bool): If True, print logs to the console.
+            log_func (callable, optional): Function that receives log messages instead of printing them.
         """
         self.base_dir = base_dir
         self.verbose = verbose
+        self.log_func = log_func
         if self.base_dir and not os.path.isabs(self.base_dir):
             raise ValueError("base_dir must be an absolute path.")
         if self.base_dir and not os.path.exists(self.base_dir):
@@ -26,10 +28,14 @@ class CookiesManager:
         """
         Logs a message to the console if verbose mode is enabled.
 
+        If a log function was provided, the message is passed to it instead.
+
         Args:
             message (str): The message to log.
         """
-        if self.verbose:
+        if self.log_func:
+            self.log_func(message)
+        elif self.verbose:
             print(message)
 
     def load_cookies(self, driver, cookie_file, initial_url):
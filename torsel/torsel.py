@@ -1,13 +1,21 @@
 import os
+import sys
+import atexit
+import glob
 import time
+import errno
+import itertools
 import socket
 import shutil
+import selectors
+import signal
 import random
 import threading
 import subprocess
-from queue import Queue
-from stem import Signal
-from stem.control import Controller
+from queue import Empty, SimpleQueue
+from concurrent.futures import ThreadPoolExecutor
+from stem import CircStatus, Signal
+from stem.control import Controller, EventType
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -53,19 +61,98 @@ class Torsel:
 
         # Initialize the CookiesManager if either cookies_dir or cookies_mapping is provided
         if cookies_dir or cookies_mapping:
-            self.cookies_manager = CookiesManager(base_dir=cookies_dir, verbose=verbose)
+            self.cookies_manager = CookiesManager(base_dir=cookies_dir, verbose=verbose, log_func=self.log)
         else:
             self.cookies_manager = None
 
+        self._torrc_template = (
+            "SocksPort {socks_port}\n"
+            "ControlPort {control_port}\n"
+            "DataDirectory {data_dir}\n"
+            "CookieAuthentication 1\n"
+            "Log notice file {notice_log}\n"
+        )
+        self._base_chrome_args = ["--no-sandbox", "--disable-dev-shm-usage"] + (["--headless"] if headless else [])
+        self._tor_processes = {}
+        self._controllers = {}
+        self._controllers_lock = threading.Lock()
+        self._last_newnym = {}
+        self._rotation_locks = {instance_num: threading.Lock() for instance_num in range(total_instances)}
+        self._listening_ports = (0.0, frozenset())
+        self._listening_ports_lock = threading.Lock()
+
+        self._log_queue = SimpleQueue()
+        self._log_thread = None
+        self._log_thread_lock = threading.Lock()
+
     def log(self, message):
         """
         Logs a message to the console if verbose mode is enabled.
 
+        Messages are queued and written by a single background thread, so workers never
+        wait on stdout.
+
         Args:
             message (str): The message to log.
         """
         if self.verbose:
-            print(message)
+            if self._log_thread is None:
+                self._start_log_writer()
+            self._log_queue.put(str(message))
+
+    def flush_log(self):
+        """
+        Blocks until every message logged so far has been written to the console.
+
+        This is called at the end of `run` and at interpreter exit, so queued messages are not lost
+        when the daemon writer thread is stopped.
+        """
+        if self.verbose and self._log_thread is not None:
+            flushed = threading.Event()
+            self._log_queue.put(flushed)
+            flushed.wait()
+
+    def _start_log_writer(self):
+        """
+        Starts the background log writer thread once, and flushes it at interpreter exit.
+        """
+        with self._log_thread_lock:
+            if self._log_thread is None:
+                self._log_thread = threading.Thread(target=self._log_writer, daemon=True)
+                self._log_thread.start()
+                atexit.register(self.flush_log)
+
+    def _log_writer(self, max_batch=64, max_delay=0.01):
+        """
+        Drains the log queue, writing messages to stdout in batches.
+
+        Args:
+            max_batch (int): Maximum number of messages written at once.
+            max_delay (float): Maximum number of seconds a message waits for its batch to fill.
+        """
+        while True:
+            batch = [self._log_queue.get()]
+            deadline = time.monotonic() + max_delay
+            while len(batch) < max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._log_queue.get(timeout=remaining))
+                except Empty:
+                    break
+
+            lines = [item for item in batch if isinstance(item, str)]
+            if lines:
+                try:
+                    sys.stdout.write("\n".join(lines) + "\n")
+                    sys.stdout.flush()
+                except Exception:
+                    # A broken stdout must not stop flush_log waiters from being released
+                    pass
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
 
     def clean_up(self):
         """
@@ -73,20 +160,159 @@ class Torsel:
         Kills any running Tor processes, frees up occupied ports, and removes old Tor profile directories.
         """
         self.log("[~] Cleaning up previous processes, files, and ports...")
-        subprocess.call(['killall', 'tor'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        time.sleep(1)
-
-        for port in range(self.tor_base_port, self.tor_base_port + self.total_instances * 10, 10):
-            if self.is_port_open(port):
-                os.system(f"fuser -k {port}/tcp")
-            if self.is_port_open(port + 101):
-                os.system(f"fuser -k {port + 101}/tcp")
+        self._graceful_kill(self.find_tor_pids(self._instance_ports()))
 
         if os.path.exists(self.tor_data_dir):
-            shutil.rmtree(self.tor_data_dir)
+            instance_dirs = glob.glob(os.path.join(self.tor_data_dir, "tor*"))
+            if instance_dirs:
+                with ThreadPoolExecutor(max_workers=max(1, min(self.max_threads, len(instance_dirs)))) as executor:
+                    list(executor.map(lambda path: shutil.rmtree(path, ignore_errors=True), instance_dirs))
+            try:
+                os.rmdir(self.tor_data_dir)
+            except OSError:
+                shutil.rmtree(self.tor_data_dir)
 
         self.log("[+] Cleanup completed.")
-        time.sleep(3)
+
+    def _graceful_kill(self, pids, grace=0.2, timeout=3):
+        """
+        Terminates processes with SIGTERM, escalating to SIGKILL for any still alive after a grace period.
+
+        Args:
+            pids (set): The process IDs to terminate.
+            grace (float): Number of seconds to wait after SIGTERM before sending SIGKILL.
+            timeout (float): Maximum number of seconds to wait for the processes to exit after SIGKILL.
+        """
+        for sig, wait in ((signal.SIGTERM, grace), (signal.SIGKILL, timeout)):
+            pids = {pid for pid in pids if not self._process_exited(pid)}
+            for pid in pids:
+                try:
+                    os.kill(pid, sig)
+                except OSError:
+                    pass
+
+            deadline = time.monotonic() + wait
+            while not all(self._process_exited(pid) for pid in pids) and time.monotonic() < deadline:
+                time.sleep(0.05)
+
+    def _process_exited(self, pid):
+        """
+        Checks whether a process has exited, reaping it if it is a child of this process.
+
+        Args:
+            pid (int): The process ID to check.
+
+        Returns:
+            bool: True if the process is gone or a zombie, False if it is still running.
+        """
+        try:
+            os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            pass
+        try:
+            with open(f"/proc/{pid}/stat") as stat_file:
+                return stat_file.read().rsplit(")", 1)[1].split()[0] == "Z"
+        except OSError:
+            return True
+
+    def _instance_ports(self):
+        """
+        Returns the SOCKS and control ports used by all Tor instances.
+
+        Returns:
+            set: The port numbers.
+        """
+        ports = set()
+        for instance_num in range(self.total_instances):
+            ports.add(self.tor_base_port + instance_num * 10)
+            ports.add(self.tor_control_base_port + instance_num * 10)
+        return ports
+
+    def find_tor_pids(self, ports):
+        """
+        Finds Tor processes and any processes bound to the given TCP ports with a single /proc scan.
+
+        Args:
+            ports (set): The port numbers whose owning processes should be found.
+
+        Returns:
+            set: The matching process IDs, excluding the current process. Empty if /proc is not available.
+        """
+        inodes = {inode for port, _, inode in self._read_tcp_sockets() if port in ports}
+
+        tor_name = os.path.basename(self.tor_path)
+        pids = set()
+        try:
+            entries = os.listdir("/proc")
+        except OSError:
+            self.log("[-] /proc is not available, skipping the scan for stale Tor processes.")
+            return pids
+
+        for entry in entries:
+            if not entry.isdigit() or int(entry) == os.getpid():
+                continue
+            try:
+                with open(f"/proc/{entry}/cmdline", "rb") as cmdline_file:
+                    argv0 = cmdline_file.read().split(b"\0", 1)[0].decode(errors="ignore")
+                if os.path.basename(argv0) == tor_name:
+                    pids.add(int(entry))
+                    continue
+                if inodes:
+                    fd_dir = f"/proc/{entry}/fd"
+                    for fd in os.listdir(fd_dir):
+                        try:
+                            target = os.readlink(os.path.join(fd_dir, fd))
+                        except OSError:
+                            # The descriptor was closed after listing it
+                            continue
+                        if target.startswith("socket:[") and target[8:-1] in inodes:
+                            pids.add(int(entry))
+                            break
+            except OSError:
+                continue
+        return pids
+
+    def _read_tcp_sockets(self):
+        """
+        Reads the kernel TCP socket tables.
+
+        Yields:
+            tuple: The local port, the hexadecimal connection state and the socket inode of each entry.
+        """
+        for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+            try:
+                with open(table) as tcp_file:
+                    next(tcp_file)
+                    for line in tcp_file:
+                        fields = line.split()
+                        yield int(fields[1].rsplit(":", 1)[1], 16), fields[3], fields[9]
+            except OSError:
+                continue
+
+    def _snapshot_listening_ports(self, max_age=1.0):
+        """
+        Returns the set of local TCP ports in the listening state.
+
+        The set is built from a single read of the socket tables and reused for up to
+        `max_age` seconds, so repeated port checks do not each cost a connection attempt.
+        Without /proc, the instance ports are probed together instead.
+
+        Args:
+            max_age (float): Maximum age in seconds of a cached snapshot.
+
+        Returns:
+            frozenset: The listening port numbers.
+        """
+        with self._listening_ports_lock:
+            taken_at, ports = self._listening_ports
+            now = time.monotonic()
+            if now - taken_at > max_age:
+                if os.path.exists("/proc/net/tcp"):
+                    ports = frozenset(port for port, state, _ in self._read_tcp_sockets() if state == "0A")
+                else:
+                    ports = frozenset(self.probe_ports(self._instance_ports()))
+                self._listening_ports = (now, ports)
+            return ports
 
     def create_tor_instance(self, instance_num):
         """
@@ -97,20 +323,96 @@ class Torsel:
         """
         self.log(f"[~] Creating Tor instance {instance_num}...")
         instance_dir = os.path.join(self.tor_data_dir, f"tor{instance_num}")
-        os.makedirs(instance_dir, exist_ok=True)
-
-        torrc_content = f'''
-SocksPort {self.tor_base_port + instance_num * 10}
-ControlPort {self.tor_control_base_port + instance_num * 10}
-DataDirectory {instance_dir}
-'''
+        try:
+            os.makedirs(instance_dir)
+        except FileExistsError:
+            pass
+
+        torrc_content = self._torrc_template.format(
+            socks_port=self.tor_base_port + instance_num * 10,
+            control_port=self.tor_control_base_port + instance_num * 10,
+            data_dir=instance_dir,
+            notice_log=os.path.join(instance_dir, "notice.log"),
+        )
         torrc_path = os.path.join(instance_dir, "torrc")
-        with open(torrc_path, 'w') as torrc_file:
-            torrc_file.write(torrc_content)
+        fd = os.open(torrc_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, torrc_content.encode())
+        finally:
+            os.close(fd)
+
+        # Python opens descriptors non-inheritable, so skipping the close_fds sweep is safe
+        process = subprocess.Popen(
+            [self.tor_path, "-f", torrc_path],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
+        )
+        self._tor_processes[instance_num] = process
+        if self.wait_for_tor_instance(instance_num, process):
+            self.log(f"[+] Tor instance {instance_num} created and running.")
+        elif process.poll() is not None:
+            self.log(f"[-] Tor instance {instance_num} exited with code {process.returncode}.")
+        else:
+            self.log(f"[-] Tor instance {instance_num} did not finish bootstrapping in time.")
+
+    def wait_for_tor_instance(self, instance_num, process=None, timeout=15, interval=0.05):
+        """
+        Waits until a Tor instance accepts SOCKS connections and has finished bootstrapping.
 
-        subprocess.Popen([self.tor_path, "-f", torrc_path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        time.sleep(5)
-        self.log(f"[+] Tor instance {instance_num} created and running.")
+        The SOCKS port is polled first, then the instance notice log is checked for the
+        "Bootstrapped 100%" message, both within the same deadline. Waiting stops early
+        if the Tor process exits.
+
+        Args:
+            instance_num (int): The index of the Tor instance.
+            process (Popen, optional): The Tor process, checked for an early exit.
+            timeout (float): Maximum number of seconds to wait.
+            interval (float): Number of seconds between checks.
+
+        Returns:
+            bool: True if the instance is ready, False if the timeout was reached or Tor exited.
+        """
+        socks_port = self.tor_base_port + instance_num * 10
+        notice_log = os.path.join(self.tor_data_dir, f"tor{instance_num}", "notice.log")
+        deadline = time.monotonic() + timeout
+
+        while not self.is_port_open(socks_port):
+            if time.monotonic() >= deadline or (process and process.poll() is not None):
+                return False
+            time.sleep(interval)
+
+        while True:
+            try:
+                with open(notice_log) as log_file:
+                    if "Bootstrapped 100%" in log_file.read():
+                        return True
+            except OSError:
+                pass
+            if time.monotonic() >= deadline or (process and process.poll() is not None):
+                return False
+            time.sleep(interval)
+
+    def create_tor_instances(self):
+        """
+        Creates all Tor instances concurrently and waits until every one of them is up.
+        """
+        with ThreadPoolExecutor(max_workers=self.total_instances) as executor:
+            list(executor.map(self.create_tor_instance, range(self.total_instances)))
+
+    def stop_tor_instances(self):
+        """
+        Terminates the Tor instances started by this object.
+        """
+        processes = list(self._tor_processes.values())
+        self._tor_processes.clear()
+        self._graceful_kill({process.pid for process in processes})
+        for process in processes:
+            try:
+                process.wait(timeout=0)
+            except subprocess.TimeoutExpired:
+                pass
 
     def configure_selenium_with_tor(self, instance_num):
         """
@@ -132,11 +434,10 @@ DataDirectory {instance_dir}
         ]
         user_agent = random.choice(user_agents)
         chrome_options = Options()
+        for argument in self._base_chrome_args:
+            chrome_options.add_argument(argument)
         chrome_options.add_argument(f"--user-agent={user_agent}")
-        if self.headless:
-            chrome_options.add_argument("--headless")
         chrome_options.add_argument(f"--proxy-server=socks5://127.0.0.1:{self.tor_base_port + instance_num * 10}")
-        chrome_options.add_argument("--no-sandbox")
 
         service = Service()
         driver = webdriver.Chrome(service=service, options=chrome_options)
@@ -148,23 +449,101 @@ DataDirectory {instance_dir}
         """
         Rotates the IP address of a Tor instance by sending the NEWNYM signal.
 
+        Rotations of the same instance run one at a time. A caller that had to wait skips its own
+        signal if a NEWNYM was sent after it asked for one, because that signal already gave the
+        instance clean circuits. Otherwise a NEWNYM is sent after sleeping out Tor's 10 second
+        rate limit (see `send_newnym`), so each returning call is followed by a fresh circuit.
+
         Args:
             instance_num (int): The index of the Tor instance.
         """
         control_port = self.tor_control_base_port + instance_num * 10
-        if self.is_port_open(control_port):
-            with Controller.from_port(port=control_port) as controller:
-                controller.authenticate()
-                controller.signal(Signal.NEWNYM)
-            time.sleep(5)
-            self.log(f"[+] IP rotated for Tor instance {instance_num}.")
-        else:
+        if control_port not in self._snapshot_listening_ports():
             self.log(f"[-] Control port {control_port} not accessible for instance {instance_num}.")
+            return
+
+        requested_at = time.monotonic()
+        with self._rotation_locks[instance_num]:
+            if self._last_newnym.get(instance_num, float("-inf")) >= requested_at:
+                self.log(f"[~] IP for Tor instance {instance_num} was already rotated by another thread, skipping.")
+                return
+
+            self._last_newnym[instance_num] = time.monotonic()
+            try:
+                rotated = self.send_newnym(self._get_controller(instance_num))
+            except Exception:
+                self._last_newnym.pop(instance_num, None)
+                raise
+            if rotated:
+                self.log(f"[+] IP rotated for Tor instance {instance_num}.")
+            else:
+                self.log(f"[-] No new circuit built for Tor instance {instance_num} after rotating IP.")
+
+    def _get_controller(self, instance_num):
+        """
+        Returns an authenticated controller for a Tor instance, connecting on first use.
+
+        Args:
+            instance_num (int): The index of the Tor instance.
+
+        Returns:
+            Controller: The controller kept open for the instance.
+        """
+        with self._controllers_lock:
+            controller = self._controllers.get(instance_num)
+            if controller is None or not controller.is_alive():
+                controller = Controller.from_port(port=self.tor_control_base_port + instance_num * 10)
+                controller.authenticate()
+                self._controllers[instance_num] = controller
+            return controller
+
+    def close_controllers(self):
+        """
+        Closes every controller kept open for the Tor instances.
+        """
+        with self._controllers_lock:
+            for controller in self._controllers.values():
+                controller.close()
+            self._controllers.clear()
+
+    def send_newnym(self, controller, timeout=5):
+        """
+        Sends NEWNYM to the Tor instance behind the given controller and waits for a clean circuit.
+
+        Tor delays a NEWNYM sent within 10 seconds of the previous one, so this first sleeps out
+        the remaining rate-limit wait, making the signal take effect as soon as it is sent. It then
+        waits for a CIRC BUILT event, i.e. a circuit built after the signal.
+
+        Args:
+            controller (Controller): An authenticated Stem controller.
+            timeout (float): Maximum number of seconds to wait for a new circuit.
+
+        Returns:
+            bool: True if a new circuit was built, False if the timeout was reached.
+        """
+        newnym_wait = controller.get_newnym_wait()
+        if newnym_wait > 0:
+            time.sleep(newnym_wait)
+
+        built = threading.Event()
+
+        def on_circuit(event):
+            if event.status == CircStatus.BUILT:
+                built.set()
+
+        controller.add_event_listener(on_circuit, EventType.CIRC)
+        try:
+            controller.signal(Signal.NEWNYM)
+            return built.wait(timeout)
+        finally:
+            controller.remove_event_listener(on_circuit)
 
     def is_port_open(self, port):
         """
         Checks if a specific port is open.
 
+        The probe gives up after 200 ms, so a loaded host cannot stall the caller.
+
         Args:
             port (int): The port number to check.
 
@@ -172,9 +551,53 @@ DataDirectory {instance_dir}
             bool: True if the port is open, False otherwise.
         """
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.settimeout(0.2)
             result = sock.connect_ex(('127.0.0.1', port))
             return result == 0
 
+    def probe_ports(self, ports, timeout=0.2):
+        """
+        Checks which of the given ports are open with concurrent non-blocking connects.
+
+        All connections are started at once and their completion is awaited through a single
+        selector, so probing many ports costs roughly one round-trip instead of one per port.
+
+        Args:
+            ports (iterable): The port numbers to check.
+            timeout (float): Maximum number of seconds to wait for the connections.
+
+        Returns:
+            set: The open port numbers.
+        """
+        open_ports = set()
+        sockets = []
+        with selectors.DefaultSelector() as selector:
+            try:
+                for port in ports:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    sockets.append(sock)
+                    sock.setblocking(False)
+                    result = sock.connect_ex(('127.0.0.1', port))
+                    if result == 0:
+                        open_ports.add(port)
+                    elif result in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                        selector.register(sock, selectors.EVENT_WRITE, port)
+
+                deadline = time.monotonic() + timeout
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    for key, _ in selector.select(remaining):
+                        if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                            open_ports.add(key.data)
+                        selector.unregister(key.fileobj)
+            finally:
+                for sock in sockets:
+                    sock.close()
+        return open_ports
+
     def load_cookies_for_url(self, driver, instance_num, current_url):
         """
         Load cookies for a specific URL based on the instance number.
@@ -216,7 +639,9 @@ DataDirectory {instance_dir}
         Executes the user-provided function with the specified Tor instance.
 
         This method handles the Selenium WebDriver setup, including configuring it with the appropriate
-        Tor instance and user agent, as well as loading cookies if specified.
+        Tor instance and user agent, as well as loading cookies if specified. Each action gets its own
+        WebDriver, which is quit afterwards, so no browser state or open connection carries over to the
+        next action after the IP is rotated.
 
         Args:
             action_num (int): The action number being performed.
@@ -249,41 +674,56 @@ DataDirectory {instance_dir}
         finally:
             driver.quit()
 
-    def thread_manager(self, queue, user_function, check_stop_func=None):
+    def thread_manager(self, next_action, num_actions, stop_event, user_function, check_stop_func=None):
         """
         Manages the execution of threads, ensuring that actions are processed concurrently.
 
-        This method creates Tor instances as needed and executes the user-defined function in separate threads.
-        It also manages retries in case of errors and ensures IP rotation between actions.
+        This method claims action numbers from a shared dispenser and executes the user-defined function
+        for each of them on its Tor instance. It also manages retries in case of errors and ensures IP
+        rotation between actions.
 
         Args:
-            queue (Queue): The queue containing action numbers.
+            next_action (callable): Returns the next unclaimed action number, shared by all workers.
+            num_actions (int): The total number of actions to perform.
+            stop_event (threading.Event): Event set once any worker decides execution should stop.
             user_function (callable): The function to execute for each action.
             check_stop_func (callable, optional): A function to check if execution should stop.
         """
-        while not queue.empty():
-            action_num = queue.get()
+        while not stop_event.is_set():
+            if check_stop_func and check_stop_func():
+                stop_event.set()
+                break
+            action_num = next_action()
+            if action_num >= num_actions:
+                break
             instance_num = action_num % self.total_instances  # Rotate between available instances
+            try:
+                self._execute_with_retry(action_num, instance_num, user_function)
+            except BaseException:
+                # Stop the other workers so the failure reaches the caller promptly
+                stop_event.set()
+                raise
+
+    def _execute_with_retry(self, action_num, instance_num, user_function):
+        """
+        Executes an action, rotating the IP after it and retrying up to five times on errors.
 
-            if action_num < self.total_instances:
-                self.create_tor_instance(instance_num)
-                time.sleep(2)
-
-            for attempt in range(5):
-                try:
-                    self.execute_function(action_num, instance_num, user_function)
-                    self.rotate_tor_ip(instance_num)
-                    break
-                except Exception as e:
-                    self.log(f"[-] Action {action_num}, Instance {instance_num} - Exception: {e}. Rotating IP and retrying...")
-                    self.rotate_tor_ip(instance_num)
-            queue.task_done()
-
-            if check_stop_func and check_stop_func():
-                while not queue.empty():
-                    queue.get_nowait()
-                    queue.task_done()
+        Args:
+            action_num (int): The action number being performed.
+            instance_num (int): The index of the Tor instance.
+            user_function (callable): The function to execute for the action.
+        """
+        for attempt in range(5):
+            try:
+                self.execute_function(action_num, instance_num, user_function)
+                self.rotate_tor_ip(instance_num)
                 break
+            except Exception as e:
+                self.log(f"[-] Action {action_num}, Instance {instance_num} - Exception: {e}. Rotating IP and retrying...")
+                self.rotate_tor_ip(instance_num)
+                # Exponential backoff with jitter gives the new circuit time to settle
+                if attempt < 4:
+                    time.sleep(min(30, (2 ** attempt) * 0.5) + random.uniform(0, 0.25))
 
     def run(self, num_actions, user_function, check_stop_func=None):
         """
@@ -292,22 +732,56 @@ DataDirectory {instance_dir}
         This method is the main entry point for executing tasks across multiple Tor instances. It handles
         the initialization, threading, and cleanup process to ensure smooth operation.
 
+        Workers run on a thread pool of up to `max_threads` threads. Under a free-threaded CPython
+        build (e.g. python3.13t) their Python-side work runs in parallel across cores; under a regular
+        build they still overlap on the browser and network I/O.
+
         Args:
             num_actions (int): The number of actions to perform.
             user_function (callable): The function to execute for each action.
             check_stop_func (callable, optional): A function to check if execution should stop.
         """
-        self.clean_up()
-
-        queue = Queue()
-        for i in range(num_actions):
-            queue.put(i)
-
-        threads = []
-        for _ in range(min(num_actions, self.max_threads)):
-            t = threading.Thread(target=self.thread_manager, args=(queue, user_function, check_stop_func))
-            t.start()
-            threads.append(t)
-
-        for t in threads:
-            t.join()
+        try:
+            self.clean_up()
+            self.create_tor_instances()
+
+            if self.total_instances == 1 and self.max_threads == 1:
+                # A single serial worker needs no dispatch or threads
+                for action_num in range(num_actions):
+                    if check_stop_func and check_stop_func():
+                        break
+                    self._execute_with_retry(action_num, 0, user_function)
+                return
+
+            # next() on a shared itertools.count is atomic under the GIL, so workers claim actions
+            # without a lock; free-threaded builds before 3.14 give no such guarantee
+            counter = itertools.count()
+            if getattr(sys, "_is_gil_enabled", lambda: True)():
+                next_action = counter.__next__
+            else:
+                counter_lock = threading.Lock()
+
+                def next_action():
+                    with counter_lock:
+                        return next(counter)
+
+            stop_event = threading.Event()
+
+            num_workers = min(num_actions, self.max_threads)
+            if num_workers < 1:
+                return
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                futures = [
+                    executor.submit(self.thread_manager, next_action, num_actions, stop_event, user_function, check_stop_func)
+                    for _ in range(num_workers)
+                ]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    stop_event.set()
+                    raise
+        finally:
+            self.close_controllers()
+            self.stop_tor_instances()
+            self.flush_log()